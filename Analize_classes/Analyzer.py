@@ -1,11 +1,14 @@
 from binance import AsyncClient
 import pandas as pd
+import numpy as np
 import logging
 
 
 class Analyzer:
     """ This class contains a various methods for analyzing a trading information. """
     __logger = logging.getLogger(__name__)
+    # Columns of the candles' array
+    TIME, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
 
     @staticmethod
     async def get_all_futures(client) -> list:
@@ -21,26 +24,22 @@ class Analyzer:
         return futures
 
     @staticmethod
-    async def __get_last_candles(client: AsyncClient, symbol: str, tf: str) -> pd.DataFrame:
+    async def __get_last_candles(client: AsyncClient, symbol: str, tf: str) -> np.ndarray:
         """
-        Return a dataframe with last candles.
+        Return an array with last candles. The columns are Time, Open, High, Low, Close, Volume.
         @param client: async client
         @param symbol: instrument
         @param tf: timeframe
-        @return: last candle
+        @return: last candles
         """
         start_str = Analyzer.__get_start_param(tf=tf)
 
         while True:
             try:
                 req = await client.futures_historical_klines(symbol, tf, start_str)
-                last_candle = pd.DataFrame(req)
-                last_candle = last_candle.iloc[:, :6]
-                last_candle.columns = ['Time', 'Open', 'High', 'Low', 'Close', 'Volume']
-                last_candle = last_candle.astype(float)
-                return last_candle
-            except pd.errors.DataError as e:
-                Analyzer.__logger.error(f'Pandas error. Wrong request during getting last candles by symbol {symbol}')
+                return np.array([kline[:6] for kline in req], dtype=np.float64).reshape(-1, 6)
+            except ValueError as e:
+                Analyzer.__logger.error(f'Wrong request during getting last candles by symbol {symbol}')
 
     @staticmethod
     def kline_tf_to_int_minutes(tf: str) -> int:
@@ -80,18 +79,18 @@ class Analyzer:
     async def get_last_bear_candle_params(client: AsyncClient, symbol: str, tf: str) -> dict:
         """
         Returns a dictionary with the open of the last bearish
-        candle and the swing's max volume from theDateFrame.
+        candle and the swing's max volume from the candles' array.
         @param client: async client
         @param symbol: instrument
         @param tf: timeframe
         @return: a dictionary with the last candle parameters
         """
         last_candles = await Analyzer.__get_last_candles(client, symbol, tf)
-        last_bear_candle = last_candles[last_candles['Open'] > last_candles['Close']].tail(1)
-        low_price = last_bear_candle['Low'].values[0]
-        volume = last_bear_candle['Volume'].values[0]
-        time = last_bear_candle['Time'].values[0]
-        swing_max_volume = last_candles[last_candles['Time'].values >= time]['Volume'].values.max()
+        last_bear_candle = last_candles[last_candles[:, Analyzer.OPEN] > last_candles[:, Analyzer.CLOSE]][-1]
+        low_price = last_bear_candle[Analyzer.LOW]
+        volume = last_bear_candle[Analyzer.VOLUME]
+        time = last_bear_candle[Analyzer.TIME]
+        swing_max_volume = last_candles[last_candles[:, Analyzer.TIME] >= time, Analyzer.VOLUME].max()
         params = {'last_bear_candle_low': low_price,
                   'last_bear_candle_volume': volume,
                   'last_bear_candle_time': time,
@@ -115,15 +114,21 @@ class Analyzer:
         return True if cur_price <= target_price else False
 
     @staticmethod
-    async def get_last_candle_params(client: AsyncClient, symbol: str, tf: str):
-
+    async def get_last_candle_params(client: AsyncClient, symbol: str, tf: str) -> dict:
+        """
+        Returns a dictionary with the high and the volume of the previous closed candle.
+        @param client: async client
+        @param symbol: instrument
+        @param tf: timeframe
+        @return: a dictionary with the previous candle parameters
+        """
         while True:
             try:
                 last_kline = await client.futures_historical_klines(symbol, tf, '3min ago UTC')
-                df = pd.DataFrame(last_kline)
-                df = df.iloc[:, :6]
-                df.columns = ['Time', 'Open', 'High', 'Low', 'Close', 'Volume']
-                return df.iloc[1].astype(float)
-            except pd.errors.DataError as e:
+                prev_candle = last_kline[1]
+                params = {'last_candle_high': float(prev_candle[Analyzer.HIGH]),
+                          'last_candle_volume': float(prev_candle[Analyzer.VOLUME])}
+                return params
+            except ValueError as e:
                 Analyzer.__logger.error(
-                    f'Pandas error. Wrong data in the dataframe during getting the last candle parameters')
+                    f'Wrong data during getting the last candle parameters by symbol {symbol}')
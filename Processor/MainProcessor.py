@@ -1,9 +1,9 @@
 import time
 import logging
-import pandas as pd
 from Analize_classes import Analyzer
 from Trade_classes import TradeProcessor
 from binance import AsyncClient, BinanceSocketManager
+from .SymbolsState import SymbolsState
 from keys import api_key, api_secret
 from enums import SWING_TRADE, CATCH_KNIVES
 import config
@@ -19,6 +19,7 @@ class MainProcessor:
         self.bm = None
         self.client = None
         self.trade_processor = None
+        self.state = None
         logging.basicConfig(
             filename='log/log.log',
             encoding='utf-8',
@@ -32,15 +33,8 @@ class MainProcessor:
 
     async def __swing_trade(self, symbol: str):
         """This is the task of the swing trade mode for one instrument."""
-        control_time = 0
-        current_high = -1.0
-        is_pump = False
-        is_volumes = False
-        printed = False
-
-        position_is_open = False
-        stop_loss = 0.0
-        take_profit = 0.0
+        st = self.state
+        i = st.row(symbol)
         tf_ms = self.analyzer.kline_tf_to_int_minutes(config.tf) * 60
 
         if config.trade_mode == SWING_TRADE:
@@ -51,52 +45,53 @@ class MainProcessor:
                     req = await ts.recv()
 
                     try:
-                        df = pd.DataFrame(req)
-                    except ValueError as e:
+                        current_price = float(req['data']['p'])
+                    except (KeyError, TypeError, ValueError) as e:
                         self.logger.error(f'Error during reading agg trades {symbol} {req = }')
                         continue
-                    current_price = float(df[df.index == 'p']['data'].values[0])
 
-                    if current_high < current_price:  # Rewrite the high of the pump
-                        current_high = current_price
+                    if st.current_high[i] < current_price:  # Rewrite the high of the pump
+                        st.current_high[i] = current_price
 
-                    if not position_is_open:  #
+                    if not st.position_is_open[i]:  #
 
-                        if cur_time >= control_time:  # Working is only at the calculated period
+                        if cur_time >= st.control_time[i]:  # Working is only at the calculated period
 
-                            is_pump = False
-                            is_volumes = False
-                            control_time = cur_time - (cur_time % tf_ms) + tf_ms
+                            st.is_pump[i] = False
+                            st.is_volumes[i] = False
+                            st.control_time[i] = cur_time - (cur_time % tf_ms) + tf_ms
                             last_bear_candle_data = await self.analyzer.get_last_bear_candle_params(
                                 self.client,
                                 symbol,
                                 config.tf)
+                            st.start_price[i] = last_bear_candle_data['last_bear_candle_low']
+                            st.start_time[i] = last_bear_candle_data['last_bear_candle_time']
 
-                            pump_lvl = last_bear_candle_data['last_bear_candle_low'] * (1 + (config.pump_height * 0.01))  # Pump high
+                            st.pump_lvl[i] = st.start_price[i] * (1 + (config.pump_height * 0.01))  # Pump high
                             coeff_volumes = last_bear_candle_data['swing_max_volume'] / last_bear_candle_data[
                                 'last_bear_candle_volume']  # The coefficient of the volumes' different
 
                             if coeff_volumes >= config.coeff_volumes:  #
-                                is_volumes = True
+                                st.is_volumes[i] = True
 
-                        if current_high >= pump_lvl and not is_pump:
-                            is_pump = True
+                        if st.current_high[i] >= st.pump_lvl[i] and not st.is_pump[i]:
+                            st.is_pump[i] = True
 
-                        if is_pump and is_volumes:  # You can open a deal
-                            if not printed:
+                        if st.is_pump[i] and st.is_volumes[i]:  # You can open a deal
+                            if not st.printed[i]:
                                 msg = f'\nThe pump at the symbol {symbol} is found.\n' \
-                                      f'Start pump price: {last_bear_candle_data["last_bear_candle_low"]}\n' \
-                                      f'Pump high: {current_high}\n' \
-                                      f'Start pump time: {last_bear_candle_data["last_bear_candle_time"]}\n\n'
+                                      f'Start pump price: {st.start_price[i]}\n' \
+                                      f'Pump high: {st.current_high[i]}\n' \
+                                      f'Start pump time: {st.start_time[i]}\n\n'
 
                                 self.logger.info(msg)
-                                printed = True
+                                st.printed[i] = True
 
-                            stop_loss = current_price * (1 + (config.stop_loss * 0.01))
-                            take_profit = current_price * (1 - (config.take_profit * 0.01))
+                            st.stop_loss[i] = stop_loss = current_price * (1 + (config.stop_loss * 0.01))
+                            st.take_profit[i] = take_profit = current_price * (1 - (config.take_profit * 0.01))
 
-                            is_rollback = self.analyzer.check_rollback(last_bear_candle_data['last_bear_candle_low'],
-                                                                       current_high,
+                            is_rollback = self.analyzer.check_rollback(st.start_price[i],
+                                                                       st.current_high[i],
                                                                        current_price,
                                                                        config.pump_rollback)
                             if is_rollback:
@@ -109,13 +104,15 @@ class MainProcessor:
                                                                              take_profit,
                                                                              SWING_TRADE):
                                     self.logger.info(f'Position {symbol} is opened. ')
-                                    position_is_open = True
-                                    is_pump = False
-                                    is_volumes = False
-                                    printed = False
-                                    current_high = -1.0
+                                    st.position_is_open[i] = True
+                                    st.is_pump[i] = False
+                                    st.is_volumes[i] = False
+                                    st.printed[i] = False
+                                    st.current_high[i] = -1.0
 
                     else:  # If there's an opened position
+                        stop_loss = float(st.stop_loss[i])
+                        take_profit = float(st.take_profit[i])
                         if current_price >= stop_loss:  # closing by SL
                             reason = 'stop loss'
                             if await self.trade_processor.close_by_market(symbol,
@@ -125,7 +122,7 @@ class MainProcessor:
                                                                           SWING_TRADE,
                                                                           reason):
                                 self.logger.info(f'The deal {symbol} closed by stop_loss. {current_price = } {stop_loss = } {take_profit = }')
-                                position_is_open = False
+                                st.position_is_open[i] = False
                         elif current_price <= take_profit:  # closing by TP
                             reason = 'take profit'
                             if await self.trade_processor.close_by_market(symbol,
@@ -135,27 +132,15 @@ class MainProcessor:
                                                                           SWING_TRADE,
                                                                           reason):
                                 self.logger.info(f'The deal {symbol} closed by take profit. {current_price = } {stop_loss = } {take_profit = }')
-                                position_is_open = False
+                                st.position_is_open[i] = False
 
     async def __catch_knives(self, symbol: str):
         """This is the task of the catch knives mode for one instrument."""
-        control_time = 0
-        prev_volume = 0
+        st = self.state
+        i = st.row(symbol)
         tf = AsyncClient.KLINE_INTERVAL_1MINUTE
-        printed = False
-        price_in_diap = False
-        volume_control = False
-        pump_control = False
-        now_time = 0
-        future_time = 0
-        up_diapason_board = 0.0
-        dn_diapason_board = 0.0
         tf_sec = self.analyzer.kline_tf_to_int_minutes(config.tf) * 60
 
-        position_is_open = False
-        stop_loss = 0.0
-        take_profit = 0.0
-
         if config.trade_mode == CATCH_KNIVES:
             async with self.bm.kline_futures_socket(symbol=symbol) as ts:
                 self.logger.info(f'{symbol} initialized.')
@@ -164,72 +149,71 @@ class MainProcessor:
                     req = await ts.recv()
 
                     try:
-                        df = pd.DataFrame(req)['k']
-                    except KeyError as e:
+                        kline = req['k']
+                        open_price = float(kline['o'])
+                        high_price = float(kline['h'])
+                        low_price = float(kline['l'])
+                        close_price = float(kline['c'])
+                        volume = float(kline['v'])
+                        cdl_time = float(kline['t'])
+                    except (KeyError, TypeError, ValueError) as e:
                         self.logger.error(f'Error during reading kline {symbol} {req = }')
                         continue
 
-                    open_price = float(df.o)
-                    high_price = float(df.h)
-                    low_price = float(df.l)
-                    close_price = float(df.c)
-                    volume = float(df.v)
-                    cdl_time = float(df.t)
-
-                    if not position_is_open:
-                        if cur_time >= control_time:
-                            volume_control = False
-                            pump_control = False
-                            now_time = 0
-                            future_time = 0
-                            up_diapason_board = 0
-                            dn_diapason_board = 0
-
-                            control_time = cur_time - (cur_time % tf_sec) + tf_sec
+                    if not st.position_is_open[i]:
+                        if cur_time >= st.control_time[i]:
+                            st.is_volumes[i] = False
+                            st.is_pump[i] = False
+                            st.now_time[i] = 0
+                            st.future_time[i] = 0
+                            st.up_board[i] = 0
+                            st.dn_board[i] = 0
+
+                            st.control_time[i] = cur_time - (cur_time % tf_sec) + tf_sec
                             prev_cdl = await self.analyzer.get_last_candle_params(self.client, symbol, tf)
-                            prev_volume = prev_cdl.Volume
-                            prev_high = prev_cdl.High
+                            st.prev_volume[i] = prev_cdl['last_candle_volume']
+                            st.prev_high[i] = prev_cdl['last_candle_high']
 
-                        pump_control_price = prev_high * (1 + (config.pump_height * 0.01))
-                        if volume > 0 and not volume_control:
-                            volume_control = True if prev_volume // volume >= config.coeff_volumes else False
-                        pump_control = True if not pump_control and high_price >= pump_control_price else False
+                        pump_control_price = st.prev_high[i] * (1 + (config.pump_height * 0.01))
+                        if volume > 0 and not st.is_volumes[i]:
+                            st.is_volumes[i] = st.prev_volume[i] // volume >= config.coeff_volumes
+                        st.is_pump[i] = not st.is_pump[i] and high_price >= pump_control_price
 
-                        if volume_control and pump_control and open_price < close_price and close_price > prev_high :  # Looking for a pump
-                            if not printed:
+                        if st.is_volumes[i] and st.is_pump[i] and open_price < close_price and close_price > st.prev_high[i]:  # Looking for a pump
+                            if not st.printed[i]:
                                 msg = f'\nThe pump at the symbol {symbol} is found.\n' \
                                       f'Start pump price: {low_price}\n' \
                                       f'Pump high: {high_price}\n' \
                                       f'Start pump time: {cdl_time}\n\n'
                                 self.logger.info(msg)
 
-                                printed = True
+                                st.printed[i] = True
                             # Init stop zone's params
-                            if now_time == 0:
-                                now_time = time.time()
-                                future_time = now_time + config.stop_diap_time
+                            if st.now_time[i] == 0:
+                                st.now_time[i] = time.time()
+                                st.future_time[i] = st.now_time[i] + config.stop_diap_time
                                 diap = close_price * (0.01 * config.stop_diap)
-                                up_diapason_board = close_price + (diap * 0.5)
-                                dn_diapason_board = close_price - (diap * 0.5)
+                                st.up_board[i] = close_price + (diap * 0.5)
+                                st.dn_board[i] = close_price - (diap * 0.5)
                                 self.logger.info(f'New stop diapason for {symbol} is calculated.')
                             # The price is in the diapason for a pointed time
-                            if cur_time >= future_time and up_diapason_board >= close_price:
-                                if close_price >= dn_diapason_board:
+                            if cur_time >= st.future_time[i] and st.up_board[i] >= close_price:
+                                if close_price >= st.dn_board[i]:
                                     self.logger.info(f'Diapason is good {symbol}.')
-                                    price_in_diap = True
-                                    now_time = 0
-                                    future_time = 0
+                                    st.price_in_diap[i] = True
+                                    st.now_time[i] = 0
+                                    st.future_time[i] = 0
                             # The price went from the diapason
-                            elif cur_time < future_time and (
-                                    close_price > up_diapason_board or close_price < dn_diapason_board):
+                            elif cur_time < st.future_time[i] and (
+                                    close_price > st.up_board[i] or close_price < st.dn_board[i]):
                                 self.logger.info(f'Diapason is broken {symbol}')
-                                price_in_diap = False
-                                now_time = 0
-                                future_time = 0
+                                st.price_in_diap[i] = False
+                                st.now_time[i] = 0
+                                st.future_time[i] = 0
 
-                            if price_in_diap:
-                                stop_loss = close_price * (1 + (config.stop_loss * 0.01))
-                                take_profit = close_price * (1 - (config.take_profit * 0.01))
+                            if st.price_in_diap[i]:
+                                st.stop_loss[i] = stop_loss = close_price * (1 + (config.stop_loss * 0.01))
+                                st.take_profit[i] = take_profit = close_price * (1 - (config.take_profit * 0.01))
                                 self.logger.info(f'Open a deal {symbol}. {close_price = } {stop_loss = } {take_profit = }')
                                 if await self.trade_processor.deal_by_market(symbol,
                                                                              config.risk_usdt_on_deal,
@@ -237,13 +221,15 @@ class MainProcessor:
                                                                              stop_loss,
                                                                              take_profit,
                                                                              CATCH_KNIVES):
-                                    position_is_open = True
-                                    printed = False
-                                    price_in_diap = False
-                                    now_time = 0
-                                    future_time = 0
+                                    st.position_is_open[i] = True
+                                    st.printed[i] = False
+                                    st.price_in_diap[i] = False
+                                    st.now_time[i] = 0
+                                    st.future_time[i] = 0
 
                     else:  # If there's an opened position
+                        stop_loss = float(st.stop_loss[i])
+                        take_profit = float(st.take_profit[i])
                         if close_price >= stop_loss:
                             reason = 'stop loss'
                             if await self.trade_processor.close_by_market(symbol,
@@ -253,7 +239,7 @@ class MainProcessor:
                                                                           SWING_TRADE,
                                                                           reason):
                                 self.logger.info(f'The deal {symbol} closed by stop_loss. {close_price = } {stop_loss = } {take_profit = }')
-                                position_is_open = False
+                                st.position_is_open[i] = False
                         elif close_price <= take_profit:
                             reason = 'take profit'
                             if await self.trade_processor.close_by_market(symbol,
@@ -263,7 +249,7 @@ class MainProcessor:
                                                                           SWING_TRADE,
                                                                           reason):
                                 self.logger.info(f'The deal {symbol} closed by take profit. {close_price = } {stop_loss = } {take_profit = }')
-                                position_is_open = False
+                                st.position_is_open[i] = False
 
     async def run(self):
         """This method needs to run in the asyncio loop."""
@@ -271,6 +257,7 @@ class MainProcessor:
         self.bm = BinanceSocketManager(self.client)
         self.trade_processor = TradeProcessor(client=self.client)
         self.f_symbols = await Analyzer.get_all_futures(client=self.client)
+        self.state = SymbolsState(self.f_symbols)
         self.tasks = []
 
         tf_in_min = self.analyzer.kline_tf_to_int_minutes(config.tf)
@@ -285,6 +272,7 @@ class MainProcessor:
             elif config.trade_mode == CATCH_KNIVES:
                 self.tasks.append(asyncio.create_task(self.__catch_knives(symbol=symbol)))
         self.logger.info(f'All tasks created.')
+        self.state.memory_report()
         for task in self.tasks:
             await task
 
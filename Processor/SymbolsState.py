@@ -0,0 +1,67 @@
+import logging
+import numpy as np
+
+
+class SymbolsState:
+    """
+    The state table of all instruments. One row per symbol, one NumPy column per parameter.
+    The detectors read and update the rows in place instead of keeping their own locals.
+    """
+    __float_columns = ('control_time',   # next time of the candles' analysis
+                       'current_high',   # the high of the pump
+                       'pump_lvl',       # the pump price
+                       'start_price',    # the low of the last bear candle
+                       'start_time',     # the time of the last bear candle
+                       'prev_volume',    # the volume of the previous candle
+                       'prev_high',      # the high of the previous candle
+                       'now_time',       # the start time of the stop diapason
+                       'future_time',    # the end time of the stop diapason
+                       'up_board',       # the upper board of the stop diapason
+                       'dn_board',       # the lower board of the stop diapason
+                       'stop_loss',
+                       'take_profit')
+    __flag_columns = ('is_pump',
+                      'is_volumes',
+                      'price_in_diap',
+                      'printed',
+                      'position_is_open')
+
+    def __init__(self, symbols: list):
+        self.logger = logging.getLogger(__name__)
+        self.symbols = list(symbols)
+        self.index = {symbol: row for row, symbol in enumerate(self.symbols)}
+        size = len(self.symbols)
+        for name in self.__float_columns:
+            setattr(self, name, np.zeros(size, dtype=np.float64))
+        for name in self.__flag_columns:
+            setattr(self, name, np.zeros(size, dtype=np.bool_))
+        self.current_high.fill(-1.0)
+
+    def row(self, symbol: str) -> int:
+        """
+        Returns the row of the instrument in the table.
+        @param symbol: instrument
+        @return: row index
+        """
+        return self.index[symbol]
+
+    def nbytes(self) -> int:
+        """
+        Returns the size of all columns in bytes.
+        @return: size of the table
+        """
+        return sum(getattr(self, name).nbytes for name in self.__float_columns + self.__flag_columns)
+
+    def memory_report(self) -> dict:
+        """
+        Writes the memory usage of the table to the log.
+        @return: a dictionary with the number of symbols, total and per-symbol bytes
+        """
+        total = self.nbytes()
+        symbols = len(self.symbols)
+        per_symbol = total // symbols if symbols else 0
+        report = {'symbols': symbols,
+                  'total_bytes': total,
+                  'per_symbol_bytes': per_symbol}
+        self.logger.info(f'State table memory: {symbols} symbols, {total} bytes, {per_symbol} bytes per symbol')
+        return report